@@ -3,4 +3,6 @@
 REGISTER_URL = '/api/register'
 USERS_URL = '/api/users/'
 USER_ID_URL = '/api/users/{user_id}'
+USERS_BULK_URL = '/api/users/bulk'
+USERS_BULK_DELETE_URL = '/api/users/bulk-delete'
 STATUS_URL = '/api/status/'
@@ -1,19 +1,92 @@
 
 import os
-from sqlalchemy import text
+from sqlalchemy import event, make_url, text
 from sqlalchemy.orm import Session
 from sqlmodel import create_engine, SQLModel
 
 # fake_db: dict[str, User] = {}
 
-db_engine = create_engine(os.getenv("DATABASE_ENGINE"), pool_size=os.getenv("DATABASE_POOL_SIZE", 10))
+# PRAGMA для SQLite, выставляются на каждое новое соединение
+SQLITE_PRAGMAS = {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous":  "NORMAL",
+        "cache_size":   -64000,  # 64 МБ (отрицательное значение - в КиБ)
+        "mmap_size":    268435456,  # 256 МБ
+        "temp_store":   "MEMORY",
+        }
+
+
+def _get_pool_size() -> int:
+    pool_size = os.getenv("DATABASE_POOL_SIZE", "10")
+    try:
+        pool_size = int(pool_size)
+    except ValueError:
+        raise ValueError(f"DATABASE_POOL_SIZE must be integer, got '{pool_size}'") from None
+
+    if pool_size < 1:
+        raise ValueError(f"DATABASE_POOL_SIZE must be greater than 0, got {pool_size}")
+
+    return pool_size
+
+
+def _set_sqlite_pragmas(dbapi_connection, _):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def _set_sqlite_query_only(dbapi_connection, _):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def _create_sqlite_engines(url) -> tuple:
+    """Создает пару движков для SQLite: один сериализованный writer и пул соединений только на чтение"""
+    # In-memory база живет внутри одного соединения и не поддерживает WAL,
+    # разделить ее между сериализованным писателем и пулом читателей нельзя
+    database = url.database or ""
+    if database in ("", ":memory:") or database.startswith("file::memory:") or url.query.get("mode") == "memory":
+        raise ValueError(f"In-memory SQLite is not supported, use a file path in DATABASE_ENGINE, got '{url}'")
+
+    connect_args = {"check_same_thread": False}
+
+    # Единственное соединение на запись: SQLite допускает только одного писателя,
+    # остальные запросы на запись ждут освобождения соединения в пуле
+    writer = create_engine(url, connect_args=connect_args, pool_size=1, max_overflow=0)
+    event.listen(writer, "connect", _set_sqlite_pragmas)
+
+    # В режиме WAL читатели не блокируют писателя и друг друга
+    reader = create_engine(url, connect_args=connect_args, pool_size=_get_pool_size(), max_overflow=0)
+    event.listen(reader, "connect", _set_sqlite_pragmas)
+    event.listen(reader, "connect", _set_sqlite_query_only)
+
+    return writer, reader
+
+
+def _create_engines() -> tuple:
+    url = make_url(os.getenv("DATABASE_ENGINE"))
+    if url.get_backend_name() == "sqlite":
+        return _create_sqlite_engines(url)
+
+    engine = create_engine(url, pool_size=_get_pool_size())
+    return engine, engine
+
+
+# db_engine - соединения на запись, db_read_engine - на чтение (для Postgres это один и тот же движок)
+db_engine, db_read_engine = _create_engines()
+
+def is_sqlite() -> bool:
+    return db_engine.dialect.name == "sqlite"
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(db_engine)
 
 def check_availability() -> bool:
     try:
-        with Session(db_engine) as session:
+        with Session(db_read_engine) as session:
             session.execute(text("SELECT 1"))
         return True
 
@@ -24,6 +97,10 @@ def check_availability() -> bool:
 
 def reset_user_sequence():
     """Сбрасывает sequence для таблицы user, чтобы избежать конфликтов с явно указанными id"""
+    if is_sqlite():
+        # INTEGER PRIMARY KEY в SQLite - это rowid, новый id всегда MAX(id) + 1, sequence нет
+        return
+
     try:
         with Session(db_engine) as session:
             # Устанавливаем sequence на максимальный существующий id + 1
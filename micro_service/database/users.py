@@ -2,12 +2,15 @@ from http import HTTPStatus
 from typing import Iterable
 
 from fastapi import HTTPException
-from sqlalchemy import func
+from sqlalchemy import delete, func, update
 from sqlmodel import select, Session
 
-from .engine import db_engine
+from .engine import db_engine, db_read_engine
 from ..models.User import User
 
+# Ограничение на число параметров в одном запросе (для SQLite - 32766)
+BULK_CHUNK_SIZE = 10000
+
 
 def get_next_user_id() -> int:
     with Session(db_engine) as session:
@@ -16,12 +19,12 @@ def get_next_user_id() -> int:
         return (max_id or 0) + 1
 
 def get_user(user_id: int) -> User | None:
-    with Session(db_engine) as session:
+    with Session(db_read_engine) as session:
         return session.get(User, user_id)
 
 
 def get_users() -> Iterable[User]:
-    with Session(db_engine) as session:
+    with Session(db_read_engine) as session:
         statement = select(User)
         return session.exec(statement).all()
 
@@ -44,7 +47,7 @@ def delete_user(user_id: int) -> None:
 
 def update_user(user_id: int, user: User) -> User:
     with Session(db_engine) as session:
-        db_user = get_user(user_id)
+        db_user = session.get(User, user_id)
         if not db_user:
             raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=f"User id='{user_id}' not found")
 
@@ -56,3 +59,43 @@ def update_user(user_id: int, user: User) -> User:
         session.refresh(db_user)
         return db_user
 
+
+def _chunks(ids: list[int]) -> Iterable[list[int]]:
+    for i in range(0, len(ids), BULK_CHUNK_SIZE):
+        yield ids[i:i + BULK_CHUNK_SIZE]
+
+def _missing_ids(ids: list[int], affected: set[int]) -> list[int]:
+    return [user_id for user_id in ids if user_id not in affected]
+
+def delete_users(ids: list[int]) -> tuple[list[int], list[int]]:
+    """Удаляет пользователей одним DELETE ... WHERE id IN (...) в одной транзакции, возвращает (удаленные, ненайденные)"""
+    ids = list(dict.fromkeys(ids))
+    deleted = []
+    with Session(db_engine) as session:
+        for chunk in _chunks(ids):
+            statement = delete(User).where(User.id.in_(chunk)).returning(User.id)
+            deleted.extend(session.execute(statement).scalars())
+        session.commit()
+
+    return sorted(deleted), _missing_ids(ids, set(deleted))
+
+def delete_users_by_filter(filters: dict) -> list[int]:
+    """Удаляет пользователей, совпадающих с фильтром по равенству полей, одним DELETE ... WHERE, возвращает удаленные id"""
+    with Session(db_engine) as session:
+        statement = delete(User).filter_by(**filters).returning(User.id)
+        deleted = session.execute(statement).scalars().all()
+        session.commit()
+
+    return sorted(deleted)
+
+def update_users(ids: list[int], user_data: dict) -> tuple[list[int], list[int]]:
+    """Обновляет пользователей одним UPDATE ... WHERE id IN (...) в одной транзакции, возвращает (обновленные, ненайденные)"""
+    ids = list(dict.fromkeys(ids))
+    updated = []
+    with Session(db_engine) as session:
+        for chunk in _chunks(ids):
+            statement = update(User).where(User.id.in_(chunk)).values(**user_data).returning(User.id)
+            updated.extend(session.execute(statement).scalars())
+        session.commit()
+
+    return sorted(updated), _missing_ids(ids, set(updated))
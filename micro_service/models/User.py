@@ -1,6 +1,9 @@
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import BaseModel, EmailStr, HttpUrl, conint, conlist, model_validator
 from sqlmodel import Field, SQLModel
 
+# id пользователя в запросах: положительный и помещается в INTEGER базы
+UserId = conint(gt=0, le=2**31 - 1)
+
 
 class User(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
@@ -29,3 +32,33 @@ class UserUpdate(BaseModel):
     last_name: str | None = None
     password: str | None = None
     avatar: HttpUrl | None = None
+
+class UserFilter(BaseModel):
+    email: EmailStr | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    token: str | None = None
+
+class BulkDeleteRequest(BaseModel):
+    ids: conlist(UserId, min_length=1) | None = None
+    filter: UserFilter | None = None
+
+    @model_validator(mode='after')
+    def check_ids_or_filter(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Exactly one of 'ids' or 'filter' must be provided")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("'filter' must contain at least one field")
+        return self
+
+class BulkDeleteResponse(BaseModel):
+    deleted: list[int]
+    missing: list[int]
+
+class BulkUpdateRequest(BaseModel):
+    ids: conlist(UserId, min_length=1)
+    update: UserUpdate
+
+class BulkUpdateResponse(BaseModel):
+    updated: list[int]
+    missing: list[int]
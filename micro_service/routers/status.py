@@ -10,5 +10,5 @@ router = APIRouter()
 
 
 @router.get(STATUS_URL, status_code=HTTPStatus.OK)
-async def status() -> AppStatus:
+def status() -> AppStatus:
     return AppStatus(database=check_availability())
@@ -4,9 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi_pagination import Page as BasePage, paginate, Params
 from fastapi_pagination.customization import CustomizedPage, UseParamsFields
 
-from micro_service.data.data_for_app import USER_ID_URL, USERS_URL
+from micro_service.data.data_for_app import USER_ID_URL, USERS_BULK_DELETE_URL, USERS_BULK_URL, USERS_URL
 from micro_service.database import users
-from micro_service.models.User import User, UserCreate, UserUpdate
+from micro_service.models.User import (BulkDeleteRequest, BulkDeleteResponse, BulkUpdateRequest, BulkUpdateResponse,
+                                       User, UserCreate, UserUpdate)
 
 router = APIRouter()
 
@@ -19,12 +20,12 @@ Page = CustomizedPage[
 
 
 @router.get(USERS_URL, response_model=Page[User], status_code=HTTPStatus.OK)
-async def get_users(params: Params = Depends()) -> Page[User]:
+def get_users(params: Params = Depends()) -> Page[User]:
     return paginate(list(users.get_users()), params=params)
 
 
 @router.get(USER_ID_URL, response_model=User, status_code=HTTPStatus.OK)
-async def get_user(user_id) -> User:
+def get_user(user_id) -> User:
     try:
         user_id = int(user_id)
     except ValueError:
@@ -45,6 +46,25 @@ def create_user(user_data: UserCreate) -> User:
     user = User(**user_dict)
     return users.create_user(user)
 
+@router.post(USERS_BULK_DELETE_URL, status_code=HTTPStatus.OK)
+def bulk_delete_users(request: BulkDeleteRequest) -> BulkDeleteResponse:
+    if request.ids is not None:
+        deleted, missing = users.delete_users(request.ids)
+    else:
+        deleted, missing = users.delete_users_by_filter(request.filter.model_dump(exclude_none=True)), []
+
+    return BulkDeleteResponse(deleted=deleted, missing=missing)
+
+# Регистрируется раньше PATCH /api/users/{user_id}, иначе 'bulk' попадет в user_id
+@router.patch(USERS_BULK_URL, status_code=HTTPStatus.OK)
+def bulk_update_users(request: BulkUpdateRequest) -> BulkUpdateResponse:
+    user_data = request.update.model_dump(mode='json', exclude_none=True, exclude_unset=True, exclude={'id'})
+    if not user_data:
+        raise HTTPException(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail="Nothing to update")
+
+    updated, missing = users.update_users(request.ids, user_data)
+    return BulkUpdateResponse(updated=updated, missing=missing)
+
 @router.patch(USER_ID_URL, status_code=HTTPStatus.OK)
 def update_user(user_id: int, user: UserUpdate) -> User:
     if user_id < 1:
@@ -1,4 +1,4 @@
-from micro_service.data.data_for_app import USER_ID_URL, USERS_URL
+from micro_service.data.data_for_app import USER_ID_URL, USERS_BULK_DELETE_URL, USERS_BULK_URL, USERS_URL
 from tests.api.base_session import BaseSession
 
 
@@ -20,3 +20,9 @@ class UsersApi(BaseSession):
 
     def delete_user(self, user_id, **kwargs):
         return self.delete(USER_ID_URL.format(user_id=user_id), **kwargs)
+
+    def bulk_delete_users(self, payload: dict, **kwargs):
+        return self.post(USERS_BULK_DELETE_URL, json=payload, **kwargs)
+
+    def bulk_update_users(self, payload: dict, **kwargs):
+        return self.patch(USERS_BULK_URL, json=payload, **kwargs)
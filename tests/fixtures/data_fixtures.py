@@ -1,4 +1,5 @@
 import json
+from http import HTTPStatus
 
 import pytest
 
@@ -24,3 +25,24 @@ def build_user_payload():
             "token":      "testtoken123",
             "password":   "P@ssw0rd!"
             }
+
+
+@pytest.fixture()
+def created_user_ids(users_api, build_user_payload):
+    """Фабрика: создает count пользователей и возвращает их id, после теста удаляет их"""
+    user_ids = []
+
+    def _create(count: int, **overrides) -> list[int]:
+        ids = []
+        for _ in range(count):
+            create_resp = users_api.create_user({**build_user_payload, **overrides})
+            assert create_resp.status_code == HTTPStatus.CREATED, \
+                f"Не удалось создать пользователя: {create_resp.status_code} {create_resp.text}"
+            ids.append(create_resp.json()["id"])
+        user_ids.extend(ids)
+        return ids
+
+    yield _create
+
+    if user_ids:
+        users_api.bulk_delete_users({"ids": user_ids})
@@ -1,5 +1,6 @@
 import json
 from http import HTTPStatus
+from uuid import uuid4
 
 import pytest
 import requests
@@ -293,3 +294,66 @@ def test_e2e_create_read_update_delete(users_api, build_user_payload):
         # Проверяем, что пользователь удален
         get_deleted = users_api.get_user(user_id=user_id)
         assert get_deleted.status_code == HTTPStatus.NOT_FOUND, "Пользователь не был удален"
+
+
+# ============= Тесты массовых операций =============
+
+def test_bulk_delete_users_by_ids(users_api, created_user_ids):
+    user_ids = created_user_ids(3)
+
+    resp = users_api.bulk_delete_users({"ids": user_ids + [999999]})
+    assert resp.status_code == HTTPStatus.OK, f"Ожидался статус 200, получен {resp.status_code}: {resp.text}"
+    assert resp.json() == {"deleted": user_ids, "missing": [999999]}, f"Неожиданный ответ: {resp.json()}"
+
+    for user_id in user_ids:
+        get_resp = users_api.get_user(user_id=user_id)
+        assert get_resp.status_code == HTTPStatus.NOT_FOUND, f"Пользователь {user_id} не был удален"
+
+
+def test_bulk_delete_users_by_filter(users_api, created_user_ids):
+    email = f"bulk.delete.{uuid4().hex}@example.com"
+    user_ids = created_user_ids(2, email=email)
+
+    resp = users_api.bulk_delete_users({"filter": {"email": email}})
+    assert resp.status_code == HTTPStatus.OK, f"Ожидался статус 200, получен {resp.status_code}: {resp.text}"
+    assert resp.json() == {"deleted": user_ids, "missing": []}, f"Неожиданный ответ: {resp.json()}"
+
+
+@pytest.mark.parametrize("payload", [
+        {},
+        {"ids": []},
+        {"ids": [-1]},
+        {"ids": [2**31]},
+        {"filter": {}},
+        {"ids": [1], "filter": {"email": "test.user@example.com"}},
+        ])
+def test_bulk_delete_invalid_payload_422(users_api, payload):
+    resp = users_api.bulk_delete_users(payload)
+    assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY, (f"Ожидался статус 422, получен"
+                                                                 f" {resp.status_code}: {resp.text}")
+
+
+def test_bulk_update_users(users_api, build_user_payload, created_user_ids):
+    user_ids = created_user_ids(3)
+
+    resp = users_api.bulk_update_users({"ids": user_ids + [999999], "update": {"token": "rotated"}})
+    assert resp.status_code == HTTPStatus.OK, f"Ожидался статус 200, получен {resp.status_code}: {resp.text}"
+    assert resp.json() == {"updated": user_ids, "missing": [999999]}, f"Неожиданный ответ: {resp.json()}"
+
+    for user_id in user_ids:
+        user = users_api.get_user(user_id=user_id).json()
+        assert user["token"] == "rotated", f"Токен пользователя {user_id} не обновлен: {user}"
+        assert user["first_name"] == build_user_payload["first_name"], \
+            f"Поле first_name пользователя {user_id} не должно было измениться: {user}"
+
+
+@pytest.mark.parametrize("payload", [
+        {"ids": [], "update": {"token": "rotated"}},
+        {"ids": [2**70], "update": {"token": "rotated"}},
+        {"ids": [1], "update": {}},
+        {"ids": [1], "update": {"email": "invalid-email"}},
+        ])
+def test_bulk_update_invalid_payload_422(users_api, payload):
+    resp = users_api.bulk_update_users(payload)
+    assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY, (f"Ожидался статус 422, получен"
+                                                                 f" {resp.status_code}: {resp.text}")